@@ -1,25 +1,71 @@
+# Patch the standard library before anything imports socket/ssl, so the
+# Brevo / reCAPTCHA / Telegram HTTP calls yield to the gevent hub instead
+# of blocking the whole worker. Only when we're actually serving under the
+# gevent worker class: gevent is always installed in production, and
+# patching under gthread/sync workers (or a preloading master about to
+# fork) would poison threading and hub state for no benefit. No-op when
+# gevent isn't installed (local dev).
 import os
+
+if os.getenv("GUNICORN_WORKER_CLASS", "gevent") == "gevent":
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+        try:
+            # psycopg2 is a C extension monkey.patch_all() can't reach; without
+            # this every DB round-trip blocks the event loop for the whole worker.
+            from psycogreen.gevent import patch_psycopg
+            patch_psycopg()
+        except ImportError:
+            pass
+    except ImportError:
+        pass
+
 import json
 import base64
+import atexit
+import functools
+import gzip
+import hmac
+import html
+import logging
+import queue
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
 import re
 import uuid
 import sib_api_v3_sdk
 from sib_api_v3_sdk.rest import ApiException
 from datetime import datetime
-from flask import Flask, request, jsonify, send_from_directory, render_template, redirect, url_for, flash, Response
+from flask import Flask, request, jsonify, send_from_directory, render_template, redirect, url_for, flash, Response, g
+from itsdangerous import URLSafeTimedSerializer, BadSignature
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from flask_admin import Admin
 from flask_admin.contrib.sqla import ModelView
 from dotenv import load_dotenv
 from flask_talisman import Talisman
 from flask_compress import Compress
+from flask_limiter import Limiter
+from cachetools import TTLCache
+from typing import Optional
+from pydantic import BaseModel, Field, ValidationError
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables
 load_dotenv()
 
+# %-style args are only formatted when the level is enabled, unlike the
+# eager f-strings the old print() calls built on every code path
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+log = logging.getLogger(__name__)
+
 # --- Configuration from Brevo/Env ---
 SECRET_KEY = os.getenv("SECRET_KEY")
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -33,21 +79,125 @@ RECAPTCHA_SECRET_KEY = os.getenv("RECAPTCHA_SECRET_KEY")
 # --- Environment Variable Checks ---
 if not SECRET_KEY or not DATABASE_URL or not BREVO_API_KEY:
     raise ValueError("Crucial Environment Variables (SECRET_KEY, DATABASE_URL, or BREVO_API_KEY) are missing.")
+if not ADMIN_USERNAME or not ADMIN_PASSWORD:
+    raise ValueError("ADMIN_USERNAME and ADMIN_PASSWORD must be set; the admin panel cannot run without credentials.")
+
+# Precomputed admin Authorization header, compared in constant time per request.
+# Kept as bytes: Werkzeug decodes headers as latin-1, so the incoming value is
+# re-encoded the same way before the comparison.
+_EXPECTED_AUTH = b'Basic ' + base64.b64encode(f'{ADMIN_USERNAME}:{ADMIN_PASSWORD}'.encode())
+
+# Short-lived signed cookie issued after the first successful Basic auth, so
+# the ~20 asset requests per admin page load verify one HMAC instead of
+# re-parsing the Authorization header each time
+_ADMIN_COOKIE = 'admin_sess'
+_ADMIN_COOKIE_MAX_AGE = 3600
+_admin_signer = URLSafeTimedSerializer(SECRET_KEY, salt='admin-sess')
     
-def spin(text):
-    """Randomly chooses words between { | } brackets"""
-    while "{" in text:
-        match = re.search(r'\{([^{}]*)\}', text)
-        if not match: break
-        options = match.group(1).split("|")
-        text = text[:match.start()] + random.choice(options) + text[match.end():]
-    return text
+# Compiled once at import so the submit hot path skips the re-cache lookup
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Spin groups need at least one | so plain {placeholder} tokens pass through
+SPIN_RE = re.compile(r'\{([^{}]*\|[^{}]*)\}')
+
+# Telegram alert bodies built once; each alert is a single .format() pass.
+# User-supplied fields get html.escape()d so Telegram's HTML parse mode can't
+# be broken (or abused) by whatever someone types into the form.
+TELEGRAM_SUBMIT_TEMPLATE = (
+    "<b>🔥 NEW APPLICATION MONSTER!</b>\n\n"
+    "<b>🆔 Case Ref:</b> <code>{short_ref}</code>\n"
+    "---------------------------\n"
+    "<b>👤 Name:</b> {full_name}\n"
+    "<b>📧 Email:</b> {email}\n"
+    "<b>📞 Phone:</b> {phone}\n"
+    "<b>💬 Preferred Contact:</b> {contact_method}\n"
+    "<b>🏠 Address:</b>\n"
+    "{address}\n"
+    "{city}, {state} {zip_code}\n"
+    "<b>🔞 18+ Verified:</b> {age_check}\n"
+    "---------------------------\n"
+    "<i>Check the Admin Panel for full history.</i>"
+)
+
+TELEGRAM_CONTACT_TEMPLATE = (
+    "<b>📩 NEW CONTACT INQUIRY</b>\n\n"
+    "<b>👤 Name:</b> {name}\n"
+    "<b>📧 Email:</b> {email}\n"
+    "<b>📝 Subject:</b> {subject}\n"
+    "<b>💬 Message:</b>\n{message}"
+)
+
+class SubmitForm(BaseModel):
+    """Shape/length gate for /submit, mirroring the DB column limits.
+
+    Validated (in Rust via pydantic-core) before the reCAPTCHA round-trip or
+    the INSERT, so oversized or malformed payloads cost microseconds, not I/O.
+    """
+    name: str = Field(min_length=1, max_length=100)
+    email: str = Field(min_length=3, max_length=100)
+    phone: str = Field(min_length=1, max_length=20)
+    contact_method: str = Field(min_length=1, max_length=20)
+    address: str = Field(min_length=1, max_length=200)
+    city: str = Field(min_length=1, max_length=100)
+    state: str = Field(min_length=1, max_length=100)
+    zip: str = Field(min_length=1, max_length=20)
+    age: Optional[str] = Field(default=None, max_length=10)
+
+# Common temporary email providers we refuse submissions from
+DISPOSABLE_DOMAINS = frozenset({
+    'tempmail.com', '10minutemail.com', 'guerrillamail.com',
+    'mailinator.com', 'dispostable.com', 'temp-mail.org',
+    'getnada.com', 'yopmail.com'
+})
+
+@functools.lru_cache(maxsize=8)
+def compile_spin(text):
+    """Pre-parses {a|b|c} groups into alternating literal / choices segments,
+    so rendering is one list walk instead of a regex pass per email."""
+    segments = []
+    pos = 0
+    for m in SPIN_RE.finditer(text):
+        if m.start() > pos:
+            segments.append(text[pos:m.start()])
+        segments.append(tuple(m.group(1).split("|")))
+        pos = m.end()
+    if pos < len(text):
+        segments.append(text[pos:])
+    return tuple(segments)
+
+def render_spin(segments):
+    return "".join(seg if isinstance(seg, str) else random.choice(seg) for seg in segments)
+
+# Fire-and-forget pool so responses never wait on outbound email/Telegram calls
+EXEC = ThreadPoolExecutor(max_workers=8)
+atexit.register(EXEC.shutdown)
+
+def _log_bg_failure(fut):
+    """Done-callback so exceptions in fire-and-forget tasks aren't swallowed."""
+    exc = fut.exception()
+    if exc:
+        log.error("Background task failed: %s", exc)
+
+# Keep-alive session so reCAPTCHA/Telegram reuse TLS connections instead of
+# paying a fresh handshake on every submission
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32, pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)))
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# Double-click submits and replays re-verify the same token; cache verdicts
+# for the ~2 min window Google considers a token valid anyway
+_RECAPTCHA_CACHE = TTLCache(maxsize=10_000, ttl=120)
 
 # Initialize Brevo
 configuration = sib_api_v3_sdk.Configuration()
 configuration.api_key['api-key'] = BREVO_API_KEY
 api_instance = sib_api_v3_sdk.TransactionalEmailsApi(sib_api_v3_sdk.ApiClient(configuration))
 
+# Fixed parts of the Brevo payload, built once instead of per email
+_EMAIL_SENDER = {"email": FROM_EMAIL, "name": "Monster Support Team"}
+_EMAIL_REPLY_TO = {"email": "support@monstercampaigns.info", "name": "Monster Support"}
+
 # --- Flask App Initialization ---
 app = Flask(__name__, template_folder='templates', static_folder='static')
 # 1. DEFINE THE SECURITY POLICY
@@ -82,17 +232,35 @@ csp = {
 
 # 2. APPLY THE PROTECTION (XSS Nonce)
 # This generates the secret nonce you'll use in your HTML
-Talisman(app, 
-         content_security_policy=None, 
-         force_https=True, 
-         session_cookie_secure=True, 
-         strict_transport_security=False)      
-
-# 3. APPLY COMPRESSION
+Talisman(app,
+         content_security_policy=csp,
+         force_https=True,
+         session_cookie_secure=True,
+         strict_transport_security=False)
+
+# 3. APPLY COMPRESSION (brotli preferred, gzip fallback; skip tiny bodies)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
 Compress(app)
 
+# 4. RATE LIMITING (per-route only, so admin/static traffic is untouched).
+# Bots that blow the limit get a 429 in pure Python before we spend a
+# reCAPTCHA round-trip or a DB insert on them.
+def _client_ip():
+    """Real client address: first hop of X-Forwarded-For behind Render's
+    proxy, remote_addr when hit directly. Keying the limiter on remote_addr
+    alone would throttle the whole site as one visitor behind the proxy."""
+    xff = request.headers.get("X-Forwarded-For")
+    return xff.split(',', 1)[0].strip() if xff else request.remote_addr
+
+limiter = Limiter(_client_ip, app=app, storage_uri="memory://")
+
 MAINTENANCE_MODE =False
 
+# Paths that stay reachable during maintenance (static assets + admin gate),
+# compiled once so the before_request hook is a single anchored match
+ALLOWED_RE = re.compile(r'^(?:/static|/akile-login-gate)')
+
 app.config['SECRET_KEY'] = SECRET_KEY
 app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
@@ -101,28 +269,71 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     "pool_pre_ping": True,
     "pool_recycle": 280,
+    # Default pool of 5 serializes writes under concurrent workers;
+    # knobs come from the environment so Render tuning needs no code change
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 20)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 40)),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+    # LIFO keeps handing out the warmest connections first
+    "pool_use_lifo": True,
 }
 
+# psycopg2-only: fold executemany INSERTs (the SUBMIT_BATCHING flusher path)
+# into single multi-VALUES statements instead of one round-trip per row
+if DATABASE_URL.startswith(("postgres://", "postgresql")):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']["executemany_mode"] = "values_plus_batch"
+
+# Opt-in profiling: PROFILE=1 wraps the app in Werkzeug's per-request
+# cProfile middleware and records SQLAlchemy query timings, so we can see
+# whether /submit is bound by Brevo, reCAPTCHA or the INSERT before tuning
+# anything further. Logs go to stdout where Render captures them.
+if os.getenv("PROFILE"):
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    app.config['SQLALCHEMY_RECORD_QUERIES'] = True
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[20], sort_by=('cumulative',))
+
 # --- Database Initialization ---
-db = SQLAlchemy(app)
+# Commit results are never re-read in a handler, so skip attribute expiry
+db = SQLAlchemy(app, session_options={"expire_on_commit": False})
 migrate = Migrate(app, db)
 
+# Maintenance page rendered + gzipped once at boot, so a bot flood during a
+# maintenance window costs a memcpy instead of a Jinja render + gzip each hit
+with app.app_context():
+    MAINTENANCE_HTML = render_template('maintenance.html').encode('utf-8')
+MAINTENANCE_GZIP = gzip.compress(MAINTENANCE_HTML, 9)
+
 @app.before_request
 def check_for_maintenance():
-    # Allow static files (images/css) and your secret admin gate to remain accessible
-    allowed_paths = ['/static', '/akile-login-gate']
-    if MAINTENANCE_MODE and not any(request.path.startswith(path) for path in allowed_paths):
-        return render_template('maintenance.html'), 503
+    if MAINTENANCE_MODE and not ALLOWED_RE.match(request.path):
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            return Response(MAINTENANCE_GZIP, status=503, headers={
+                'Content-Encoding': 'gzip',
+                'Content-Type': 'text/html; charset=utf-8',
+                'Content-Length': str(len(MAINTENANCE_GZIP))
+            })
+        return Response(MAINTENANCE_HTML, status=503, mimetype='text/html')
         
+# Render the Jinja template once at import with {token} placeholders; each
+# email is then just the compiled spin segments plus one format_map pass.
+with app.app_context():
+    _EMAIL_BODY = render_template(
+        'email_template.html',
+        name='{name}', brand='{brand}', color='{color}',
+        padding='{padding}', short_id='{short_id}', uid='{uid}')
+_EMAIL_SEGMENTS = compile_spin(_EMAIL_BODY)
+
 # --- PLACE 1: THE EMAIL MACHINE (UPDATED VERSION) ---
 def send_monster_email(email, full_name, uid):
 
     # 2. Setup Variables
     short_id = uid[:8].upper()
     brand_name = "Monster Partner"
-    
+
     random_data = {
-        "name": full_name,
+        # The only user-supplied value in the template; escape it so a name
+        # like "<img src=x onerror=...>" can't inject markup into the email
+        "name": html.escape(full_name),
         "brand": brand_name,
         "color": "#95D600",
         "padding": random.randint(20, 30),
@@ -130,42 +341,53 @@ def send_monster_email(email, full_name, uid):
         "uid": uid
     }
 
-    
+
     try:
-        raw_html = render_template('email_template.html', **random_data)
-        final_html = spin(raw_html)
+        final_html = render_spin(_EMAIL_SEGMENTS).format_map(random_data)
     except Exception as e:
-        print(f"CRITICAL ERROR: Template render failed: {e}")
+        log.error("Template render failed: %s", e)
         return
 
     
-    # Randomize the Sender Name metadata
     final_subject = f"Regarding your inquiry, {full_name} (Ref: #{short_id})"
-    final_sender_name = "Monster Support Team"
 
-    # 5. Brevo Send
+    # 5. Brevo Send (only the recipient/subject/body vary per email)
     send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(
         to=[{"email": email, "name": full_name}],
-        sender={"email": FROM_EMAIL, "name": final_sender_name}, 
-        reply_to={"email": "support@monstercampaigns.info", "name": "Monster Support"},
+        sender=_EMAIL_SENDER,
+        reply_to=_EMAIL_REPLY_TO,
         subject=final_subject,
         html_content=final_html
     )
 
     try:
         api_instance.send_transac_email(send_smtp_email)
-        print(f"SUCCESS: Inbox-optimized email sent to {email}")
+        log.info("Inbox-optimized email sent to %s", email)
     except Exception as e:
-        print(f"FAILURE: Brevo error: {e}")
+        log.error("Brevo error: %s", e)
         
         # 2. Telegram Alert Machine
+def _verify_recaptcha(token, ip):
+    """Posts to siteverify and byte-scans the tiny trusted body for the
+    success flag, skipping json.loads on the hot path."""
+    recaptcha_req = SESSION.post("https://www.google.com/recaptcha/api/siteverify", data={
+        'secret': RECAPTCHA_SECRET_KEY,
+        'response': token,
+        'remoteip': ip
+    }, timeout=HTTP_TIMEOUT)
+    body = recaptcha_req.content
+    ok = b'"success": true' in body or b'"success":true' in body
+    if not ok:
+        log.warning("reCAPTCHA failed: %s", body)
+    return ok
+
 def send_telegram_alert(message):
     token = os.environ.get('TELEGRAM_BOT_TOKEN')
     chat_id = os.environ.get('TELEGRAM_CHAT_ID')
 
     # Guard clause: Stop if keys are missing
     if not token or not chat_id:
-        print("TELEGRAM ERROR: Keys not found in environment variables.")
+        log.error("Telegram keys not found in environment variables.")
         return
 
     url = f"https://api.telegram.org/bot{token}/sendMessage"
@@ -176,20 +398,25 @@ def send_telegram_alert(message):
     }
 
     try:
-        response = requests.post(url, data=payload, timeout=10)
+        response = SESSION.post(url, data=payload, timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
-            print("SUCCESS: Telegram alert sent.")
+            log.info("Telegram alert sent.")
         else:
-            print(f"TELEGRAM API ERROR: {response.text}")
+            log.error("Telegram API error: %s", response.text)
     except Exception as e:
-        print(f"ERROR: Telegram failed: {e}")
+        log.error("Telegram failed: %s", e)
         
         
 # --- Database Model ---
 class Submission(db.Model):
+    # Backs the admin panel's state/city filters and default timestamp sort
+    __table_args__ = (
+        db.Index('ix_submission_state_city', 'state', 'city'),
+        db.Index('ix_submission_timestamp', 'timestamp'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     full_name = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(100), nullable=False, unique=True, index=True)
     phone = db.Column(db.String(20), nullable=False)
     contact_method = db.Column(db.String(20), nullable=False)
     address = db.Column(db.String(200), nullable=False)
@@ -202,6 +429,67 @@ class Submission(db.Model):
     user_agent = db.Column(db.String(255))
     browser_metadata = db.Column(db.Text)  
     fingerprint_id = db.Column(db.String(100))
+# --- Opt-in write-behind batching for campaign spikes ---
+# With SUBMIT_BATCHING=1 the handler enqueues the row and a daemon thread
+# coalesces up to 200 rows (or 100 ms) into one executemany INSERT,
+# amortizing the per-row commit fsync. Default stays synchronous so a
+# single submission is never at risk of being dropped on shutdown.
+SUBMIT_BATCHING = os.getenv("SUBMIT_BATCHING") == "1"
+SUBMIT_Q = queue.Queue()
+
+# Emails enqueued in the last few minutes. The unique index only rejects a
+# duplicate once the flusher gets to it, which is after the handler has
+# already fired the confirmation email and Telegram alert — this set lets
+# the batching branch bounce repeats up front, like the sync path's
+# IntegrityError catch does.
+_RECENT_SUBMITS = TTLCache(maxsize=10_000, ttl=300)
+
+def _flush_rows(rows):
+    """Inserts a drained batch, retrying row-by-row on failure so a single
+    duplicate doesn't sink the rest. Pushes an app context because db.engine
+    resolves via current_app and the flusher thread has none of its own."""
+    with app.app_context():
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(insert(Submission.__table__), rows)
+        except Exception:
+            for row in rows:
+                try:
+                    with db.engine.begin() as conn:
+                        conn.execute(insert(Submission.__table__).values(**row))
+                except IntegrityError:
+                    pass
+                except Exception as e:
+                    log.error("Submit insert failed: %s", e)
+
+def _drain_submit_queue():
+    while True:
+        rows = [SUBMIT_Q.get()]
+        deadline = time.monotonic() + 0.1
+        while len(rows) < 200:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(SUBMIT_Q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _flush_rows(rows)
+
+# Started lazily on first enqueue rather than at import: under gunicorn
+# --preload the module imports only in the master, and a thread started
+# there wouldn't survive the fork — each worker must own its flusher.
+_flusher_lock = threading.Lock()
+_flusher_started = False
+
+def _ensure_flusher():
+    global _flusher_started
+    if not _flusher_started:
+        with _flusher_lock:
+            if not _flusher_started:
+                threading.Thread(target=_drain_submit_queue, daemon=True).start()
+                _flusher_started = True
+
 # --- Flask-Admin Setup ---
 class AuthenticatedModelView(ModelView):
 # --- UI & FEATURE SETTINGS ---
@@ -217,14 +505,20 @@ class AuthenticatedModelView(ModelView):
     page_size = 100
     
     def is_accessible(self):
-        auth_header = request.headers.get('Authorization')
-        if not auth_header: return False
+        tok = request.cookies.get(_ADMIN_COOKIE)
+        if tok:
+            try:
+                _admin_signer.loads(tok, max_age=_ADMIN_COOKIE_MAX_AGE)
+                return True
+            except BadSignature:
+                pass
         try:
-            auth_type, credentials = auth_header.split(None, 1)
-            if auth_type.lower() == 'basic':
-                username, password = base64.b64decode(credentials).decode('utf-8').split(':', 1)
-                return username == ADMIN_USERNAME and password == ADMIN_PASSWORD
-        except: pass
+            auth_header = request.headers.get('Authorization', '').encode('latin-1')
+        except UnicodeError:
+            return False
+        if hmac.compare_digest(auth_header, _EXPECTED_AUTH):
+            g.set_admin_cookie = True
+            return True
         return False
 
     def inaccessible_callback(self, name, **kwargs):
@@ -233,6 +527,14 @@ class AuthenticatedModelView(ModelView):
 admin = Admin(app, name='Monster Admin', url='/akile-login-gate', template_mode='bootstrap3')
 admin.add_view(AuthenticatedModelView(Submission, db.session))
 
+@app.after_request
+def issue_admin_cookie(response):
+    if g.get('set_admin_cookie'):
+        response.set_cookie(_ADMIN_COOKIE, _admin_signer.dumps('ok'),
+                            max_age=_ADMIN_COOKIE_MAX_AGE, httponly=True,
+                            secure=True, samesite='Lax')
+    return response
+
 # --- Routes ---
 @app.route('/')
 def index():
@@ -241,6 +543,11 @@ def index():
 @app.route('/thankyou')
 def thankyou_page():
     return render_template('thank_you.html')
+
+# Precomputed once so the submit hot path skips the URL builder; 303 makes
+# the browser GET the thank-you page instead of re-POSTing on back/refresh
+with app.test_request_context():
+    THANKYOU_URL = url_for('thankyou_page')
     
 @app.route('/privacy')
 def privacy_page():
@@ -257,13 +564,14 @@ def favicon():
 @app.route('/robots.txt')
 @app.route('/sitemap.xml')
 def static_from_root():
-    return send_from_directory(app.static_folder, request.path[1:])
+    return send_from_directory(app.static_folder, request.path[1:], max_age=86400)
 
 @app.route('/unsubscribe')
 def unsubscribe_page():
     return render_template('unsubscribe.html')
     
 @app.route('/contact', methods=['GET', 'POST'])
+@limiter.limit("10 per minute", methods=["POST"])
 def contact():
     if request.method == 'POST':
         # 1. Capture the form data
@@ -273,115 +581,114 @@ def contact():
         message = request.form.get('message')
 
         # 2. Format the message for Telegram
-        contact_alert = (
-            f"<b>📩 NEW CONTACT INQUIRY</b>\n\n"
-            f"<b>👤 Name:</b> {name}\n"
-            f"<b>📧 Email:</b> {email}\n"
-            f"<b>📝 Subject:</b> {subject}\n"
-            f"<b>💬 Message:</b>\n{message}"
+        contact_alert = TELEGRAM_CONTACT_TEMPLATE.format(
+            name=html.escape(name or ''),
+            email=html.escape(email or ''),
+            subject=html.escape(subject),
+            message=html.escape(message or '')
         )
 
-        # 3. Send the alert using your existing function
-        try:
-            send_telegram_alert(contact_alert)
-        except Exception as e:
-            print(f"Contact Alert Error: {e}")
+        # 3. Send the alert in the background, same as the submit path
+        EXEC.submit(send_telegram_alert, contact_alert).add_done_callback(_log_bg_failure)
 
         # 4. Trigger the success state in contact.html
         return render_template('contact.html', success=True)
         
     return render_template('contact.html')
     
-@app.route('/sitemap.xml')
-def serve_sitemap():
-    return send_from_directory('static', 'sitemap.xml')
-
 @app.route('/submit', methods=['POST'])
+@limiter.limit("5 per minute")
 def submit_application():
     try:
         # If this hidden field is filled, it's a bot.
         if request.form.get('website'):
             return "OK", 200 # Silent kill: Bot thinks it succeeded
             
-        # 1. Capture data from form
-        full_name = request.form.get('name')
-        email = request.form.get('email', '').lower().strip()
-        phone = request.form.get('phone')
-        contact_method = request.form.get('contact_method')
-        address = request.form.get('address')
-        city = request.form.get('city')
-        state = request.form.get('state')
-        zip_code = request.form.get('zip')
-        age_check = request.form.get('age') 
+        # 1. Validate + capture form data (cheap gate before any network/DB I/O)
+        try:
+            form = SubmitForm.model_validate(request.form.to_dict())
+        except ValidationError:
+            return "Invalid form data. Please go back and try again.", 400
+
+        full_name = form.name
+        email = form.email.lower().strip()
+        phone = form.phone
+        contact_method = form.contact_method
+        address = form.address
+        city = form.city
+        state = form.state
+        zip_code = form.zip
+        age_check = form.age
         recaptcha_response = request.form.get('g-recaptcha-response')
         ua = request.form.get('user_agent')
         meta = request.form.get('browser_metadata')
         fp = request.form.get('fingerprint_id')
         
         # --- NEW: BACKEND REGEX VALIDATION ---
-        email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        # List of common temporary email providers
-        blacklist = [
-            'tempmail.com', '10minutemail.com', 'guerrillamail.com', 
-            'mailinator.com', 'dispostable.com', 'temp-mail.org', 
-            'getnada.com', 'yopmail.com'
-        ]
-
-        if not re.match(email_regex, email):
+        if not EMAIL_RE.match(email):
             return "Invalid email format. Please go back.", 400
 
         # Check if the domain is in our blacklist
-        domain = email.split('@')[-1]
-        if domain in blacklist:
+        domain = email.rsplit('@', 1)[-1]
+        if domain in DISPOSABLE_DOMAINS:
             return "To ensure you receive our partnership updates, please provide a standard email address. We are unable to send responses to temporary or disposable domains.", 400
         
-        # --- NEW: DUPLICATE PROTECTION ---
-        # Check if this email already exists in our database
-        existing_user = Submission.query.filter_by(email=email).first()
-        
-        if existing_user:
-            # If they already exist, don't save anything! 
-            # Just show them the thank you page so they don't try again.
-            return render_template('thank_you.html')
-        
-        # Capture the IP Address
-        if request.headers.getlist("X-Forwarded-For"):
-            ip = request.headers.getlist("X-Forwarded-For")[0]
-        else:
-            ip = request.remote_addr
-        # 2. reCAPTCHA Verification
-        recaptcha_verify_url = "https://www.google.com/recaptcha/api/siteverify"
-        recaptcha_req = requests.post(recaptcha_verify_url, data={
-            'secret': RECAPTCHA_SECRET_KEY,
-            'response': recaptcha_response,
-            'remoteip': ip
-        })
-        if not recaptcha_req.json().get('success'):
-            return "reCAPTCHA failed. Please go back and try again.", 400
-            
-        uid = str(uuid.uuid4())
-        
-
-        # 3. Save to Database
+        # Capture the IP Address (first hop of X-Forwarded-For if present)
+        ip = _client_ip()
+        # 2. reCAPTCHA Verification (cached per token+IP to absorb
+        # double-submits). A cache miss fires the Google round-trip on the
+        # pool so the insert row is prepared while the verdict is in flight.
+        recaptcha_key = (recaptcha_response, ip)
+        recaptcha_ok = _RECAPTCHA_CACHE.get(recaptcha_key)
+        recaptcha_future = None
+        if recaptcha_ok is None:
+            recaptcha_future = EXEC.submit(_verify_recaptcha, recaptcha_response, ip)
+
+        uid = uuid.uuid4().hex
+
+        # 3. Save to Database via a Core insert — this endpoint never reads the
+        # row back, so skip the ORM identity-map/flush machinery entirely.
         # Note: We convert age_check to a Boolean (True/False) for the database
-        new_submission = Submission(
-            full_name=full_name, 
-            email=email, 
+        row = dict(
+            full_name=full_name,
+            email=email,
             phone=phone,
-            contact_method=contact_method, 
+            contact_method=contact_method,
             address=address,
-            city=city, 
-            state=state, 
-            zip_code=zip_code, 
+            city=city,
+            state=state,
+            zip_code=zip_code,
             age_18_plus=(age_check == 'yes'),
             ip_address=ip,
             user_agent=ua,
             browser_metadata=meta,
             fingerprint_id=uid
         )
-        db.session.add(new_submission)
-        db.session.commit()
+
+        # Collect the reCAPTCHA verdict before the row touches the DB
+        if recaptcha_future is not None:
+            recaptcha_ok = recaptcha_future.result(timeout=15)
+            _RECAPTCHA_CACHE[recaptcha_key] = recaptcha_ok
+        if not recaptcha_ok:
+            return "reCAPTCHA failed. Please go back and try again.", 400
+
+        if SUBMIT_BATCHING:
+            # Spike mode: enqueue and let the flusher amortize the commit.
+            # Repeats are bounced here because the unique-index rejection in
+            # the flusher would come too late to stop the sends below.
+            if email in _RECENT_SUBMITS:
+                return redirect(THANKYOU_URL, code=303)
+            _RECENT_SUBMITS[email] = True
+            _ensure_flusher()
+            SUBMIT_Q.put(row)
+        else:
+            # Duplicate protection lives on the unique email index: a repeat
+            # submit fails the INSERT and just gets the thank you page again.
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(insert(Submission.__table__).values(**row))
+            except IntegrityError:
+                return redirect(THANKYOU_URL, code=303)
 
         # 4. Prepare Email Data
         template_data = {
@@ -392,41 +699,39 @@ def submit_application():
         }
         
         # It picks the 'email' and 'full_name' from Step 1
-        send_monster_email(email, full_name, uid)
+        EXEC.submit(send_monster_email, email, full_name, uid).add_done_callback(_log_bg_failure)
 
         # Send alert to YOUR Telegram (Place this here!)
-        alert_text = (
-            f"<b>🔥 NEW APPLICATION MONSTER!</b>\n\n"
-            f"<b>🆔 Case Ref:</b> <code>{uid[:8].upper()}</code>\n"
-            f"---------------------------\n"
-            f"<b>👤 Name:</b> {full_name}\n"
-            f"<b>📧 Email:</b> {email}\n"
-            f"<b>📞 Phone:</b> {phone}\n"
-            f"<b>💬 Preferred Contact:</b> {contact_method}\n"
-            f"<b>🏠 Address:</b>\n"
-            f"{address}\n"
-            f"{city}, {state} {zip_code}\n"
-            f"<b>🔞 18+ Verified:</b> {age_check}\n"
-            f"---------------------------\n"
-            f"<i>Check the Admin Panel for full history.</i>"
+        alert_text = TELEGRAM_SUBMIT_TEMPLATE.format(
+            short_ref=uid[:8].upper(),
+            full_name=html.escape(full_name or ''),
+            email=html.escape(email),
+            phone=html.escape(phone or ''),
+            contact_method=html.escape(contact_method or ''),
+            address=html.escape(address or ''),
+            city=html.escape(city or ''),
+            state=html.escape(state or ''),
+            zip_code=html.escape(zip_code or ''),
+            age_check=age_check
         )
-        send_telegram_alert(alert_text)
-        return render_template('thank_you.html')
+        EXEC.submit(send_telegram_alert, alert_text).add_done_callback(_log_bg_failure)
+        return redirect(THANKYOU_URL, code=303)
 
     except Exception as e:
         db.session.rollback()
-        print(f"CRITICAL ERROR: {e}")
+        log.exception("Submit failed: %s", e)
         return "Internal Server Error", 500
 
-# --- Database Creation & App Run ---
-if __name__ == "__main__":
-    with app.app_context():
-        try:
-            db.create_all()
-            print("[INFO] Database tables checked/created.")
-        except Exception as e:
-            print(f"[ERROR] Database creation failed: {e}")
+# --- Database Creation (one-shot: run `flask init-db` or `flask db upgrade`
+# from the deploy script instead of paying schema introspection per worker) ---
+@app.cli.command("init-db")
+def init_db():
+    """Create database tables."""
+    db.create_all()
+    print("[INFO] Database tables checked/created.")
 
+# --- App Run ---
+if __name__ == "__main__":
     # Bind to 0.0.0.0 and the Starter Port
     port = int(os.environ.get("PORT", 10000))
     app.run(host='0.0.0.0', port=port)
@@ -0,0 +1,18 @@
+import os
+
+# Tuned for an I/O-bound form app: every submit fans out to reCAPTCHA,
+# Brevo and Telegram, so gevent workers keep sockets busy instead of
+# blocking threads. Knobs are env-driven so Render tuning needs no commit.
+workers = int(os.getenv("WEB_CONCURRENCY", 4))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+# Import the app once in the master so templates, compiled regexes and the
+# pre-rendered email/maintenance blobs are copy-on-write shared across workers.
+# Off by default under gevent: importing app.py monkey-patches the master
+# process, and hub/socket state must not be inherited across fork.
+_default_preload = "0" if worker_class == "gevent" else "1"
+preload_app = os.getenv("GUNICORN_PRELOAD", _default_preload) == "1"
+keepalive = 5
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+accesslog = "-"
+errorlog = "-"
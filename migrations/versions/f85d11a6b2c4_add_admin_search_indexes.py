@@ -0,0 +1,39 @@
+"""Add admin search indexes
+
+Revision ID: f85d11a6b2c4
+Revises: c41b72d90e15
+Create Date: 2026-08-31 11:04:17.550211
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f85d11a6b2c4'
+down_revision = 'c41b72d90e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('submission', schema=None) as batch_op:
+        batch_op.create_index('ix_submission_state_city', ['state', 'city'], unique=False)
+        batch_op.create_index('ix_submission_timestamp', ['timestamp'], unique=False)
+
+    # Trigram GIN indexes so Flask-Admin's ILIKE '%term%' search is
+    # index-backed on Postgres (no-op on SQLite dev databases)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX ix_submission_full_name_trgm ON submission USING gin (full_name gin_trgm_ops)")
+        op.execute("CREATE INDEX ix_submission_email_trgm ON submission USING gin (email gin_trgm_ops)")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_submission_email_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_submission_full_name_trgm")
+
+    with op.batch_alter_table('submission', schema=None) as batch_op:
+        batch_op.drop_index('ix_submission_timestamp')
+        batch_op.drop_index('ix_submission_state_city')
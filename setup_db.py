@@ -1,5 +0,0 @@
-from app import app, db
-
-with app.app_context():
-    db.create_all()
-    print("Database tables created successfully!")
\ No newline at end of file
@@ -0,0 +1,60 @@
+import os
+import tempfile
+
+# Minimal env so app.py imports; a throwaway SQLite file stands in for Postgres
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("BREVO_API_KEY", "test-brevo-key")
+os.environ.setdefault("ADMIN_USERNAME", "admin")
+os.environ.setdefault("ADMIN_PASSWORD", "admin")
+_db_fd, _db_path = tempfile.mkstemp(suffix=".db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+from app import app, db, Submission, _flush_rows
+
+
+def _make_row(email):
+    return dict(
+        full_name="Test User",
+        email=email,
+        phone="5551234567",
+        contact_method="email",
+        address="1 Main St",
+        city="Corona",
+        state="CA",
+        zip_code="92879",
+        age_18_plus=True,
+        ip_address="127.0.0.1",
+        user_agent="pytest",
+        browser_metadata=None,
+        fingerprint_id="abc123",
+    )
+
+
+def test_flushed_rows_land_in_table():
+    with app.app_context():
+        db.create_all()
+
+    # _flush_rows is called from the batching thread with no context of its
+    # own, so invoke it bare to prove it pushes one itself
+    _flush_rows([_make_row("flush-one@example.com")])
+
+    with app.app_context():
+        count = db.session.query(Submission).filter_by(
+            email="flush-one@example.com").count()
+    assert count == 1
+
+
+def test_duplicate_in_batch_does_not_sink_the_rest():
+    with app.app_context():
+        db.create_all()
+
+    _flush_rows([_make_row("dupe@example.com")])
+    _flush_rows([_make_row("dupe@example.com"), _make_row("fresh@example.com")])
+
+    with app.app_context():
+        dupes = db.session.query(Submission).filter_by(
+            email="dupe@example.com").count()
+        fresh = db.session.query(Submission).filter_by(
+            email="fresh@example.com").count()
+    assert dupes == 1
+    assert fresh == 1